@@ -1,8 +1,8 @@
 from __future__ import annotations
 
 import logging
-from itertools import product
-from typing import TYPE_CHECKING, Dict, Generic, Iterator, List, Sequence, Set, Tuple, TypeVar
+import operator
+from typing import TYPE_CHECKING, Callable, Dict, Generic, Iterator, List, Optional, Sequence, Set, Tuple, TypeVar
 
 import decompiler.structures.pseudo as pseudo
 from decompiler.structures.logic.logic_interface import ConditionInterface, PseudoLogicInterface
@@ -18,6 +18,84 @@ if TYPE_CHECKING:
 
 LOGICCLASS = TypeVar("LOGICCLASS", bound="CustomLogicCondition")
 PseudoLOGICCLASS = TypeVar("PseudoLOGICCLASS", bound="PseudoCustomLogicCondition")
+T = TypeVar("T")
+
+# Names of the tables of the structure cache.
+_STRUCTURE_TABLE = "structure"
+_LENGTH_TABLE = "length"
+_KEY_TABLE = "key"
+_SYMBOLS_TABLE = "symbols"
+_LITERALS_TABLE = "literals"
+
+
+class _StructureCache:
+    """
+    Memoize structural properties of the nodes of a World, like the length or whether a node is in cnf-form.
+
+    The entries are keyed by the ids of the nodes. Some properties, like the symbols of a node, consist of nodes themselves.
+    All entries are only valid as long as the World is not modified, because no node of an unmodified World is freed.
+    Therefore, each modification of the World has to go through CustomLogicCondition._modify_context, which drops all entries
+    as well as all interned keys.
+    """
+
+    # The World of the simplifier has no place for additional data, so we store the cache as attribute of the World.
+    # This way, the cache lives exactly as long as its World and is not shared between Worlds.
+    _ATTRIBUTE = "_custom_logic_structure_cache"
+
+    def __init__(self):
+        self._tables: Dict[str, Dict[int, object]] = dict()
+        self._interned: Dict[object, int] = dict()
+
+    @classmethod
+    def of(cls, world: World) -> _StructureCache:
+        """Return the cache of the given world."""
+        if (cache := getattr(world, cls._ATTRIBUTE, None)) is None:
+            cache = cls()
+            setattr(world, cls._ATTRIBUTE, cache)
+        return cache
+
+    def lookup(self, name: str, node: WorldObject) -> Optional[object]:
+        """Return the cached property with the given name of the given node, if it exists."""
+        if (table := self._tables.get(name)) is None:
+            return None
+        return table.get(id(node))
+
+    def store(self, name: str, node: WorldObject, value: object) -> None:
+        """Cache the given value as property with the given name of the given node."""
+        self._tables.setdefault(name, dict())[id(node)] = value
+
+    def intern(self, structure: object) -> int:
+        """Return the integer key of the given hashable structure. The structure must not contain any nodes of the World."""
+        return self._interned.setdefault(structure, len(self._interned))
+
+    def invalidate(self) -> None:
+        """Drop all entries, because the world was modified."""
+        self._tables.clear()
+        self._interned.clear()
+
+
+# Structure flags of a node: symbol, literal, disjunction of literals, conjunction of literals, cnf-form and dnf-form.
+_SYMBOL = 1
+_LITERAL = 2
+_CLAUSE = 4
+_CUBE = 8
+_CNF = 16
+_DNF = 32
+
+# Symbols of the comparisons: the negation of each comparison and the comparisons that are mirrored by swapping the operands.
+_NEGATED_COMPARISONS = {
+    "==": "!=",
+    "!=": "==",
+    "s<": "s>=",
+    "s<=": "s>",
+    "s>": "s<=",
+    "s>=": "s<",
+    "u<": "u>=",
+    "u<=": "u>",
+    "u>": "u<=",
+    "u>=": "u<",
+}
+_MIRRORED_COMPARISONS = {"s>": "s<", "s>=": "s<=", "u>": "u<", "u>=": "u<="}
 
 
 class CustomLogicCondition(ConditionInterface, Generic[LOGICCLASS]):
@@ -43,14 +121,12 @@ class CustomLogicCondition(ConditionInterface, Generic[LOGICCLASS]):
 
     def __len__(self) -> int:
         """Return the length of a formula, which corresponds to its complexity."""
-        if isinstance(self._condition, Variable):
+        if isinstance(condition := self._condition, Variable):
             return 1
-        count = 0
-        for node in self.context.iter_postorder(self._condition):
-            if not isinstance(node, Operation):
-                continue
-            count += sum(1 for op in node.operands if isinstance(op, Variable))
-        return count
+        if (length := self._cache.lookup(_LENGTH_TABLE, condition)) is None:
+            self._analyze(condition)
+            length = self._cache.lookup(_LENGTH_TABLE, condition)
+        return length
 
     def __str__(self) -> str:
         """Return a string representation."""
@@ -113,15 +189,26 @@ class CustomLogicCondition(ConditionInterface, Generic[LOGICCLASS]):
         """Return context of logic condition."""
         return self._variable.world
 
+    @property
+    def _cache(self) -> _StructureCache:
+        """Return the cache for the structural properties of the nodes of the context."""
+        return _StructureCache.of(self.context)
+
+    def _modify_context(self, modification: Callable[..., T], *args) -> T:
+        """Apply the given modification of the context and drop all cached structural properties, because they may be outdated."""
+        result = modification(*args)
+        self._cache.invalidate()
+        return result
+
     @property
     def is_true(self) -> bool:
         """Check whether the tag is the 'true-symbol'."""
-        return isinstance(self._condition, Constant) and self._condition.unsigned != 0
+        return isinstance(condition := self._condition, Constant) and condition.unsigned != 0
 
     @property
     def is_false(self) -> bool:
         """Check whether the tag is the 'false-symbol'."""
-        return isinstance(self._condition, Constant) and self._condition.unsigned == 0
+        return isinstance(condition := self._condition, Constant) and condition.unsigned == 0
 
     @property
     def is_disjunction(self) -> bool:
@@ -145,11 +232,15 @@ class CustomLogicCondition(ConditionInterface, Generic[LOGICCLASS]):
 
     def _get_operands(self, tmp: bool = False) -> List[LOGICCLASS]:
         """Get operands."""
+        return [self.__class__(operand, tmp) for operand in self._get_world_operands()]
+
+    def _get_world_operands(self) -> List[WorldObject]:
+        """Get operands on World-level, without wrapping them into conditions."""
         condition = self._condition
         if isinstance(condition, BitVector):
             return []
         assert isinstance(condition, Operation), f"The condition must be an operation."
-        return [self.__class__(operand, tmp) for operand in condition.operands]
+        return list(condition.operands)
 
     @property
     def is_symbol(self) -> bool:
@@ -174,50 +265,57 @@ class CustomLogicCondition(ConditionInterface, Generic[LOGICCLASS]):
     @property
     def is_cnf_form(self) -> bool:
         """Check whether the condition is already in cnf-form."""
-        if self.is_true or self.is_false or self.is_disjunction_of_literals:
-            return True
-        return self.is_conjunction and all(self._is_disjunction_of_literals(clause) for clause in self._condition.operands)
+        return bool(self._classify(self._condition) & _CNF)
 
     def is_equal_to(self, other: LOGICCLASS) -> bool:
         """Check whether the conditions are equal, i.e., have the same from except the ordering."""
-        return World.compare(self._condition, other._condition)
+        condition, other_condition = self._condition, other._condition
+        return condition is other_condition or World.compare(condition, other_condition)
 
     def does_imply(self, other: LOGICCLASS) -> bool:
         """Check whether the condition implies the given condition."""
-        tmp_condition = self.__class__(self.context.bitwise_or(self._custom_negate(self._condition), other._condition))
-        self.context.free_world_condition(tmp_condition._variable)
-        tmp_condition._variable.simplify()
-        does_imply_value = tmp_condition.is_true
-        self.context.cleanup([tmp_condition._variable])
+        if other.is_true or self.is_false:
+            return True
+        if self._get_conjunct_keys(other._condition) <= self._get_conjunct_keys(self._condition):
+            return True
+        implication = self.context.new_variable(1)
+        self.context.define(implication, self.context.bitwise_or(self._custom_negate(self._condition), other._condition))
+        self._modify_context(self.context.free_world_condition, implication)
+        self._modify_context(implication.simplify)
+        simplified_implication = self.context.get_definition(implication)
+        does_imply_value = isinstance(simplified_implication, Constant) and simplified_implication.unsigned != 0
+        self._modify_context(self.context.cleanup, [implication])
         return does_imply_value
 
     def to_cnf(self) -> LOGICCLASS:
         """Bring the condition tag into cnf-form."""
         if self.is_cnf_form:
             return self
-        self.context.free_world_condition(self._variable)
-        ToCnfVisitor(self._variable)
+        self._modify_context(self.context.free_world_condition, self._variable)
+        self._modify_context(ToCnfVisitor, self._variable)
         return self
 
     def to_dnf(self) -> LOGICCLASS:
         """Bring the condition tag into dnf-form."""
         dnf_form = self.copy()
-        self.context.free_world_condition(dnf_form._variable)
-        ToDnfVisitor(dnf_form._variable)
+        if self._is_dnf_form(self._condition):
+            return dnf_form
+        self._modify_context(self.context.free_world_condition, dnf_form._variable)
+        self._modify_context(ToDnfVisitor, dnf_form._variable)
         return dnf_form
 
     def simplify(self) -> LOGICCLASS:
         """Simplify the given condition. Make sure that it does not destroy cnf-form."""
-        if isinstance(self._variable, Variable):
-            self.context.free_world_condition(self._variable)
-            self._variable.simplify()
+        if isinstance(self._variable, Variable) or (isinstance(self._variable, TmpVariable) and hasattr(self._variable, "simplify")):
+            self._modify_context(self.context.free_world_condition, self._variable)
+            self._modify_context(self._variable.simplify)
         else:
             new_var = self.context.variable(f"Simplify", 1)
             self.context.define(new_var, self._condition)
-            self.context.free_world_condition(new_var)
-            new_var.simplify()
+            self._modify_context(self.context.free_world_condition, new_var)
+            self._modify_context(new_var.simplify)
             self._variable = self.context.new_variable(1, tmp=True)
-            self.context.substitute(new_var, self._variable)
+            self._modify_context(self.context.substitute, new_var, self._variable)
         return self
 
     def get_symbols(self) -> Iterator[LOGICCLASS]:
@@ -248,40 +346,72 @@ class CustomLogicCondition(ConditionInterface, Generic[LOGICCLASS]):
             return self
 
         self.to_cnf()
-        if self.is_true or self.is_false or self.is_negation or self.is_symbol:
+        cnf_condition = self._condition
+        if isinstance(cnf_condition, (Constant, BitwiseNegate)) or self._is_symbol(cnf_condition):
             return self
 
         condition_operands: List[LOGICCLASS] = condition._get_operands()
-        operands: List[LOGICCLASS] = self._get_operands()
-        numb_of_arg_expr: int = len(operands) if self.is_conjunction else 1
+        numb_of_arg_expr: int = len(cnf_condition.operands) if isinstance(cnf_condition, BitwiseAnd) else 1
         numb_of_arg_cond: int = len(condition_operands) if condition.is_conjunction else 1
 
         if numb_of_arg_expr <= numb_of_arg_cond:
-            self.context.cleanup()
+            self._modify_context(self.context.cleanup)
             return self
 
         subexpressions: List[LOGICCLASS] = [condition] if numb_of_arg_cond == 1 else condition_operands
-        self._replace_subexpressions_by_true(subexpressions)
-        to_remove = [cond._variable for cond in condition_operands + operands if cond._variable != cond._condition]
-        self.context.cleanup(to_remove)
+        wrapped_operands: List[LOGICCLASS] = self._replace_subexpressions_by_true(subexpressions)
+        to_remove = [cond._variable for cond in condition_operands + wrapped_operands if cond._variable != cond._condition]
+        self._modify_context(self.context.cleanup, to_remove)
         return self
 
-    def _replace_subexpressions_by_true(self, subexpressions: List[LOGICCLASS]):
-        """Replace each clause of the Custom-Condition by True, if it is contained in the list of given subexpressions."""
-        for sub_expr_1, sub_expr_2 in product(subexpressions, self.operands):
-            if sub_expr_1.is_equivalent_to(sub_expr_2):
-                relations = self.context.get_relation(self._condition, sub_expr_2._condition)
+    def _replace_subexpressions_by_true(self, subexpressions: List[LOGICCLASS]) -> List[LOGICCLASS]:
+        """
+        Replace each clause of the Custom-Condition by True, if it is contained in the list of given subexpressions.
+
+        Return the conditions that were created for the operands to check the equivalence, so the caller can remove them.
+        """
+        operands: List[WorldObject] = self._get_world_operands()
+        operands_by_key: Dict[int, List[WorldObject]] = dict()
+        for operand in operands:
+            operands_by_key.setdefault(self._canonical_key(operand), list()).append(operand)
+        only_clauses = all(self._is_clause_without_tautology(operand) for operand in operands)
+        # Removing an operand invalidates all keys, so we compute the keys of the clauses beforehand.
+        clause_keys: List[Optional[int]] = list()
+        for sub_expr in subexpressions:
+            is_clause = only_clauses and self._is_clause_without_tautology(sub_condition := sub_expr._condition)
+            clause_keys.append(self._canonical_key(sub_condition) if is_clause else None)
+        wrapped_operands: List[LOGICCLASS] = [self.__class__(operand) for operand in operands] if None in clause_keys else list()
+        replaced_operands: Set[int] = set()
+        for sub_expr_1, clause_key in zip(subexpressions, clause_keys):
+            if len(replaced_operands) == len(operands):
+                break
+            # Two clauses without complementary literals are equivalent if and only if they consist of the same literals.
+            if clause_key is not None:
+                equivalent_operands = operands_by_key.pop(clause_key, list())
+            else:
+                equivalent_operands = [
+                    operand
+                    for operand, wrapped_operand in zip(operands, wrapped_operands)
+                    if id(operand) not in replaced_operands and sub_expr_1.is_equivalent_to(wrapped_operand)
+                ]
+            for operand in equivalent_operands:
+                if id(operand) in replaced_operands:
+                    continue
+                replaced_operands.add(id(operand))
+                relations = self.context.get_relation(self._condition, operand)
                 for relation in relations:
-                    self.context.remove_operand(self._condition, relation.sink)
+                    self._modify_context(self.context.remove_operand, self._condition, relation.sink)
+        return wrapped_operands
 
     def _replace_condition_by_true(self) -> None:
         """Replace the Custom Logic condition by True."""
-        if self.is_symbol:
-            self._variable: BaseVariable = self.context.new_variable(self._condition.size)
+        condition = self._condition
+        if self._is_symbol(condition):
+            self._variable: BaseVariable = self.context.new_variable(condition.size)
             self.context.define(self._variable, self.context.constant(1, 1))
         else:
-            self.context.replace(self._condition, self.context.constant(1, 1))
-        self.context.cleanup()
+            self._modify_context(self.context.replace, condition, self.context.constant(1, 1))
+        self._modify_context(self.context.cleanup)
 
     def remove_redundancy(self, condition_handler: ConditionHandler) -> LOGICCLASS:
         """
@@ -291,19 +421,21 @@ class CustomLogicCondition(ConditionInterface, Generic[LOGICCLASS]):
         - This helps, for example for finding switch cases, because it simplifies the condition
           'x1 & x2' if 'x1 = var < 10' and 'x2 = var == 5' to the condition 'x2'.
         """
-        if self.is_literal or self.is_true or self.is_false:
+        condition = self._condition
+        if self._is_literal(condition) or isinstance(condition, Constant):
             return self
-        assert isinstance(self._condition, Operation), "We only remove redundancy for operations"
+        assert isinstance(condition, Operation), "We only remove redundancy for operations"
 
-        real_condition, compared_expressions = self._replace_symbols_by_real_conditions(condition_handler)
+        z3_condition_map: Dict[LOGICCLASS, PseudoCustomLogicCondition] = condition_handler.get_z3_condition_map()
+        real_condition, compared_expressions = self._replace_symbols_by_real_conditions(condition_handler, z3_condition_map)
 
-        self.context.free_world_condition(real_condition._variable)
+        self._modify_context(self.context.free_world_condition, real_condition._variable)
         real_condition.simplify()
 
-        self._replace_real_conditions_by_symbols(real_condition, compared_expressions, condition_handler)
+        self._replace_real_conditions_by_symbols(real_condition, compared_expressions, condition_handler, z3_condition_map)
 
-        self.context.replace(self._condition, real_condition._condition)
-        self.context.cleanup()
+        self._modify_context(self.context.replace, self._condition, real_condition._condition)
+        self._modify_context(self.context.cleanup)
         return self
 
     def _replace_real_conditions_by_symbols(
@@ -311,27 +443,26 @@ class CustomLogicCondition(ConditionInterface, Generic[LOGICCLASS]):
         real_condition: PseudoCustomLogicCondition,
         compared_expressions: Dict[Variable, pseudo.Expression],
         condition_handler: ConditionHandler,
+        z3_condition_map: Dict[LOGICCLASS, PseudoCustomLogicCondition],
     ):
         """Replace all clauses of the given real-condition by symbols."""
-        non_logic_operands = {
+        non_logic_operands = [
             node
             for node in self.context.iter_postorder(real_condition._variable)
-            if isinstance(node, Operation) and not isinstance(node, (BitwiseOr, BitwiseAnd, BitwiseNegate))
-        }
-        replacement_dict = {
-            real_cond._condition: symbol._condition
-            for symbol, real_cond in condition_handler.get_z3_condition_map().items()
-            if any(operand in compared_expressions for operand in real_cond._condition.operands)
-        }
-        for operand in non_logic_operands:
-            negated_operand = operand.copy_tree().negate()
-            for condition, symbol in replacement_dict.items():
-                if World.compare(condition, operand):
-                    self.context.replace(operand, symbol)
-                    break
-                if World.compare(condition, negated_operand):
-                    self.context.replace(operand, self.context.bitwise_negate(symbol))
-                    break
+            if isinstance(node, Operation) and node.__class__ not in (BitwiseOr, BitwiseAnd, BitwiseNegate)
+        ]
+        replacement_by_key: Dict[int, Tuple[WorldObject, bool]] = dict()
+        for symbol, real_cond in z3_condition_map.items():
+            condition = real_cond._condition
+            if isinstance(condition, Operation) and any(operand in compared_expressions for operand in condition.operands):
+                replacement_by_key.setdefault(self._canonical_key(condition), (symbol._condition, False))
+                replacement_by_key.setdefault(self._canonical_key_of_negation(condition), (symbol._condition, True))
+        # Replacing an operand invalidates all keys, so we compute them beforehand.
+        operand_keys = [self._canonical_key(operand) for operand in non_logic_operands]
+        for operand, operand_key in zip(non_logic_operands, operand_keys):
+            if (replacement := replacement_by_key.get(operand_key)) is not None:
+                symbol, negated = replacement
+                self._modify_context(self.context.replace, operand, self.context.bitwise_negate(symbol) if negated else symbol)
             else:
                 new_operands = list()
                 for op in operand.operands:
@@ -341,42 +472,52 @@ class CustomLogicCondition(ConditionInterface, Generic[LOGICCLASS]):
                         assert isinstance(op, Constant), f"The operand must be a Constant"
                         new_operands.append(pseudo.Constant(op.signed, pseudo.Integer(op.size, signed=True)))
                 condition_symbol = condition_handler.add_condition(Condition(self.OPERAND_MAPPING[operand.SYMBOL], new_operands))
-                self.context.replace(operand, condition_symbol._condition)
+                self._modify_context(self.context.replace, operand, condition_symbol._condition)
 
     def _replace_symbols_by_real_conditions(
-        self, condition_handler: ConditionHandler
+        self, condition_handler: ConditionHandler, z3_condition_map: Dict[LOGICCLASS, PseudoCustomLogicCondition]
     ) -> Tuple[PseudoCustomLogicCondition, Dict[Variable, pseudo.Expression]]:
         """
         Return the real condition where the symbols are replaced by the conditions of the condition handler
         as well as a mapping between the replaced symbols and the corresponding pseudo-expression.
         """
+        symbols = [self.__class__(symbol) for symbol in self._get_symbols(self._condition)]
         copied_condition = PseudoCustomLogicCondition(self._condition)
-        self.context.free_world_condition(copied_condition._variable)
+        self._modify_context(self.context.free_world_condition, copied_condition._variable)
         condition_nodes = set(self.context.iter_postorder(copied_condition._variable))
         compared_expressions: Dict[Variable, pseudo.Expression] = dict()
-        for symbol in self.get_symbols():
+        world_variables: Dict[int, Variable] = dict()
+        world_conditions: Dict[Variable, WorldObject] = dict()
+        for symbol in symbols:
+            world_conditions[symbol._condition] = z3_condition_map[symbol]._condition
             pseudo_condition: Condition = condition_handler.get_condition_of(symbol)
             for operand in pseudo_condition.operands:
-                if not isinstance(operand, pseudo.Constant):
-                    compared_expressions[self.context.variable(self._variable_name_for(operand))] = operand
-            self._replace_symbol(symbol, condition_handler, condition_nodes)
+                if isinstance(operand, pseudo.Constant):
+                    continue
+                if (world_variable := world_variables.get(id(operand))) is None:
+                    world_variable = world_variables[id(operand)] = self.context.variable(self._variable_name_for(operand))
+                compared_expressions[world_variable] = operand
+        self._replace_symbols(world_conditions, condition_nodes)
         return copied_condition, compared_expressions
 
-    def _replace_symbol(self, symbol: CustomLogicCondition, condition_handler: ConditionHandler, condition_nodes: Set[WorldObject]):
+    def _replace_symbols(self, world_conditions: Dict[Variable, WorldObject], condition_nodes: Set[WorldObject]):
         """
-        Replace the given symbol by the corresponding pseudo-condition.
+        Replace each symbol by the corresponding pseudo-condition.
 
-        :symbol: The symbol we want to replace in the custom-logic-condition
-        :condition_handler: The object handling the connection between the symbols, the pseudo-logic-condition, and the "real" condition
+        :world_conditions: Maps each symbol we want to replace in the custom-logic-condition to the corresponding "real" condition.
         :condition_nodes: The set of all nodes in the world that belong to the custom-logic condition where we replace the symbols.
         """
-        world_condition = condition_handler.get_z3_condition_of(symbol)._condition
-        world_symbol = symbol._condition
-        for parent in [parent for parent in self.context.parent_operation(world_symbol) if parent in condition_nodes]:
+        symbol_occurrences: List[Tuple[Operation, Variable]] = [
+            (parent, world_symbol)
+            for parent in condition_nodes
+            if isinstance(parent, Operation)
+            for world_symbol in dict.fromkeys(operand for operand in parent.operands if operand in world_conditions)
+        ]
+        for parent, world_symbol in symbol_occurrences:
             for relation in self.context.get_relation(parent, world_symbol):
                 index = relation.index
-                self.context.remove_operand(parent, relation.sink)
-                self.context.add_operand(parent, world_condition, index)
+                self._modify_context(self.context.remove_operand, parent, relation.sink)
+                self._modify_context(self.context.add_operand, parent, world_conditions[world_symbol], index)
 
     def serialize(self) -> str:
         """Serialize the given condition into a SMT2 string representation."""
@@ -408,46 +549,206 @@ class CustomLogicCondition(ConditionInterface, Generic[LOGICCLASS]):
             - the negation of a symbol or
             - a disjunction of symbols or negation of symbols.
         """
-        if self._is_literal(condition):
-            return True
-        return isinstance(condition, BitwiseOr) and all(self._is_literal(operand) for operand in condition.operands)
+        return bool(self._classify(condition) & _CLAUSE)
+
+    def _is_dnf_form(self, condition: WorldObject) -> bool:
+        """Check whether the given condition is already in dnf-form."""
+        return bool(self._classify(condition) & _DNF)
+
+    def _classify(self, condition: WorldObject) -> int:
+        """Return the structure flags of the given condition."""
+        if (flags := self._cache.lookup(_STRUCTURE_TABLE, condition)) is None:
+            self._analyze(condition)
+            flags = self._cache.lookup(_STRUCTURE_TABLE, condition)
+        return flags
+
+    def _analyze(self, condition: WorldObject) -> None:
+        """Compute the structure flags of all nodes of the given condition as well as its length in a single postorder pass."""
+        cache = self._cache
+        length = 0
+        for node in self.context.iter_postorder(condition):
+            if cache.lookup(_STRUCTURE_TABLE, node) is None:
+                cache.store(_STRUCTURE_TABLE, node, self._get_structure_flags(node))
+            if isinstance(node, Operation):
+                length += sum(1 for op in node.operands if isinstance(op, Variable))
+        cache.store(_LENGTH_TABLE, condition, length)
+
+    def _get_structure_flags(self, node: WorldObject) -> int:
+        """Return the structure flags of the given node, given that all its operands are already classified."""
+        return self._STRUCTURE_FLAGS_HANDLERS.get(type(node), CustomLogicCondition._get_structure_flags_of_other)(self, node)
+
+    def _get_structure_flags_of_constant(self, node: Constant) -> int:
+        return _CNF | _DNF
+
+    def _get_structure_flags_of_other(self, node: WorldObject) -> int:
+        return 0
+
+    def _get_structure_flags_of_variable(self, node: Variable) -> int:
+        return _SYMBOL | _LITERAL | _CLAUSE | _CUBE | _CNF | _DNF if self._is_symbol(node) else 0
+
+    def _get_structure_flags_of_negation(self, node: BitwiseNegate) -> int:
+        return _LITERAL | _CLAUSE | _CUBE | _CNF | _DNF if self._classify(node.operand) & _SYMBOL else 0
+
+    def _get_structure_flags_of_disjunction(self, node: BitwiseOr) -> int:
+        operand_flags = self._get_common_operand_flags(node)
+        flags = _CLAUSE | _CNF if operand_flags & _LITERAL else 0
+        return flags | _DNF if operand_flags & _CUBE else flags
+
+    def _get_structure_flags_of_conjunction(self, node: BitwiseAnd) -> int:
+        operand_flags = self._get_common_operand_flags(node)
+        flags = _CUBE | _DNF if operand_flags & _LITERAL else 0
+        return flags | _CNF if operand_flags & _CLAUSE else flags
+
+    def _get_common_operand_flags(self, node: Operation) -> int:
+        operand_flags = _SYMBOL | _LITERAL | _CLAUSE | _CUBE | _CNF | _DNF
+        for operand in node.operands:
+            operand_flags &= self._classify(operand)
+        return operand_flags
+
+    def _is_clause_without_tautology(self, condition: WorldObject) -> bool:
+        """Check whether the given condition is a disjunction of literals that does not contain a symbol as well as its negation."""
+        if not self._is_disjunction_of_literals(condition):
+            return False
+        literals = condition.operands if isinstance(condition, BitwiseOr) else [condition]
+        symbols = {literal for literal in literals if not isinstance(literal, BitwiseNegate)}
+        return all(literal.operand not in symbols for literal in literals if isinstance(literal, BitwiseNegate))
+
+    def _get_conjunct_keys(self, condition: WorldObject) -> Set[int]:
+        """Return the canonical keys of the conjuncts of the given condition."""
+        if isinstance(condition, BitwiseAnd):
+            return {self._canonical_key(operand) for operand in condition.operands}
+        return {self._canonical_key(condition)}
+
+    def _canonical_key(self, condition: WorldObject) -> int:
+        """
+        Return an integer key of the given condition that does not depend on the order and repetition of the operands of conjunctions
+        and disjunctions. Mirrored comparisons, like a < b and b > a, as well as a negated comparison and its inverse have the same key.
 
-    def _get_symbols(self, condition: WorldObject) -> Iterator[Variable]:
+        The keys are computed bottom-up in a single postorder pass. Conditions with the same key are equivalent.
+        """
+        cache = self._cache
+        if (key := cache.lookup(_KEY_TABLE, condition)) is None:
+            for node in self.context.iter_postorder(condition):
+                if cache.lookup(_KEY_TABLE, node) is None:
+                    cache.store(_KEY_TABLE, node, self._get_key_of_node(node))
+            key = cache.lookup(_KEY_TABLE, condition)
+        return key
+
+    def _get_key_of_node(self, node: WorldObject) -> int:
+        """Return the canonical key of the given node, given that all its operands already have a key."""
+        cache = self._cache
+        if isinstance(node, Constant):
+            return cache.intern((Constant, node.unsigned, node.size))
+        if not isinstance(node, Operation):
+            return cache.intern((node.__class__, node.name, node.size))
+        if isinstance(node, BitwiseNegate):
+            return self._canonical_key_of_negation(node.operand)
+        operand_keys = [self._canonical_key(operand) for operand in node.operands]
+        if isinstance(node, (BitwiseAnd, BitwiseOr)):
+            if len(distinct_keys := sorted(set(operand_keys))) == 1:
+                return distinct_keys[0]
+            return cache.intern((node.__class__, tuple(distinct_keys)))
+        if node.SYMBOL in _NEGATED_COMPARISONS:
+            return self._get_key_of_comparison(node.SYMBOL, operand_keys)
+        return cache.intern((node.__class__, node.size, tuple(operand_keys)))
+
+    def _canonical_key_of_negation(self, condition: WorldObject) -> int:
+        """Return the canonical key of the negation of the given condition. The negation of a comparison is the inverse comparison."""
+        if isinstance(condition, Operation) and condition.SYMBOL in _NEGATED_COMPARISONS:
+            operand_keys = [self._canonical_key(operand) for operand in condition.operands]
+            return self._get_key_of_comparison(_NEGATED_COMPARISONS[condition.SYMBOL], operand_keys)
+        return self._cache.intern((BitwiseNegate, self._canonical_key(condition)))
+
+    def _get_key_of_comparison(self, symbol: str, operand_keys: List[int]) -> int:
+        """Return the canonical key of the comparison with the given symbol and operands, which is the same for mirrored comparisons."""
+        if symbol in _MIRRORED_COMPARISONS:
+            symbol, operand_keys = _MIRRORED_COMPARISONS[symbol], operand_keys[::-1]
+        elif symbol in ("==", "!="):
+            operand_keys = sorted(operand_keys)
+        return self._cache.intern((Operation, symbol, tuple(operand_keys)))
+
+    def _get_symbols(self, condition: WorldObject) -> Tuple[Variable, ...]:
         """Get symbols on World-level"""
-        for node in self.context.iter_postorder(condition):
-            if self._is_symbol(node):
-                yield node
+        if (symbols := self._cache.lookup(_SYMBOLS_TABLE, condition)) is None:
+            symbols = tuple(node for node in self.context.iter_postorder(condition) if self._is_symbol(node))
+            self._cache.store(_SYMBOLS_TABLE, condition, symbols)
+        return symbols
 
-    def _get_literals(self, condition: WorldObject) -> Iterator[WorldObject]:
+    def _get_literals(self, condition: WorldObject) -> Tuple[WorldObject, ...]:
         """Get literals on World-level"""
-        if self._is_literal(condition):
+        if (literals := self._cache.lookup(_LITERALS_TABLE, condition)) is None:
+            literals = tuple(self._iter_literals(condition))
+            self._cache.store(_LITERALS_TABLE, condition, literals)
+        return literals
+
+    def _iter_literals(self, condition: WorldObject) -> Iterator[WorldObject]:
+        return self._LITERALS_HANDLERS.get(type(condition), CustomLogicCondition._iter_literals_of_constant)(self, condition)
+
+    def _iter_literals_of_variable(self, condition: Variable) -> Iterator[WorldObject]:
+        if self._is_symbol(condition):
             yield condition
-        elif isinstance(condition, (BitwiseOr, BitwiseAnd, BitwiseNegate)):
-            for child in condition.operands:
-                yield from self._get_literals(child)
         else:
-            assert isinstance(condition, Constant) and condition.size == 1, f"The condition {condition} does not consist of literals."
+            yield from self._iter_literals_of_constant(condition)
+
+    def _iter_literals_of_negation(self, condition: BitwiseNegate) -> Iterator[WorldObject]:
+        if self._is_symbol(condition.operand):
+            yield condition
+        else:
+            yield from self._iter_literals(condition.operand)
+
+    def _iter_literals_of_operands(self, condition: Operation) -> Iterator[WorldObject]:
+        for child in condition.operands:
+            yield from self._iter_literals(child)
+
+    def _iter_literals_of_constant(self, condition: WorldObject) -> Iterator[WorldObject]:
+        assert isinstance(condition, Constant) and condition.size == 1, f"The condition {condition} does not consist of literals."
+        yield from ()
 
     def _rich_string_representation(self, condition: WorldObject, condition_map: Dict[Variable, pseudo.Condition]) -> str:
         """Replace each symbol of the given condition by the pseudo-condition of the condition map and return this condition as string."""
-        if self._is_symbol(condition):
-            if condition in condition_map:
-                return str(condition_map[condition])
-            return f"{condition}"
-        if isinstance(condition, Constant) and condition.size == 1:
-            return "false" if condition.unsigned == 0 else "true"
-        if isinstance(condition, BitwiseNegate):
-            original_condition = condition.operand
+        representations: Dict[int, str] = dict()
+        stack: List[Tuple[WorldObject, bool]] = [(condition, False)]
+        while stack:
+            node, operands_visited = stack.pop()
+            if id(node) in representations:
+                continue
+            if not operands_visited and (operands := self._get_represented_operands(node, condition_map)):
+                stack.append((node, True))
+                stack.extend((operand, False) for operand in operands)
+                continue
+            representations[id(node)] = self._rich_string_of_node(node, condition_map, representations)
+        return representations[id(condition)]
+
+    def _get_represented_operands(self, node: WorldObject, condition_map: Dict[Variable, pseudo.Condition]) -> Sequence[WorldObject]:
+        """Return the operands of the given node whose representation is part of the representation of the node."""
+        if isinstance(node, BitwiseNegate):
+            return [] if node.operand in condition_map else [node.operand]
+        if isinstance(node, (BitwiseOr, BitwiseAnd)):
+            return node.operands
+        return []
+
+    def _rich_string_of_node(
+        self, node: WorldObject, condition_map: Dict[Variable, pseudo.Condition], representations: Dict[int, str]
+    ) -> str:
+        """Return the representation of the given node, given the representations of its represented operands."""
+        if self._is_symbol(node):
+            if node in condition_map:
+                return str(condition_map[node])
+            return f"{node}"
+        if isinstance(node, Constant) and node.size == 1:
+            return "false" if node.unsigned == 0 else "true"
+        if isinstance(node, BitwiseNegate):
+            original_condition = node.operand
             if original_condition in condition_map:
                 return str(condition_map[original_condition].negate())
-            return f"!{self._rich_string_representation(original_condition, condition_map)}"
-        if isinstance(condition, (BitwiseOr, BitwiseAnd)):
-            operands = condition.operands
-            symbol = "|" if isinstance(condition, BitwiseOr) else "&"
+            return "".join(("!", representations[id(original_condition)]))
+        if isinstance(node, (BitwiseOr, BitwiseAnd)):
+            operands = node.operands
             if len(operands) == 1:
-                return self._rich_string_representation(operands[0], condition_map)
-            return "(" + f" {symbol} ".join([f"{self._rich_string_representation(operand, condition_map)}" for operand in operands]) + ")"
-        return f"{condition}"
+                return representations[id(operands[0])]
+            symbol = " | " if isinstance(node, BitwiseOr) else " & "
+            return "".join(("(", symbol.join(representations[id(operand)] for operand in operands), ")"))
+        return f"{node}"
 
     @staticmethod
     def _variable_name_for(expression: pseudo.Expression) -> str:
@@ -455,6 +756,22 @@ class CustomLogicCondition(ConditionInterface, Generic[LOGICCLASS]):
             return f"{expression},{expression.ssa_name}"
         return f"{expression},{[str(var.ssa_name) for var in expression.requirements]}"
 
+    # Handlers per exact node type, which are only read. All other node types use the fallback given at the lookup.
+    _STRUCTURE_FLAGS_HANDLERS: Dict[type, Callable] = {
+        Constant: _get_structure_flags_of_constant,
+        Variable: _get_structure_flags_of_variable,
+        BitwiseNegate: _get_structure_flags_of_negation,
+        BitwiseOr: _get_structure_flags_of_disjunction,
+        BitwiseAnd: _get_structure_flags_of_conjunction,
+    }
+
+    _LITERALS_HANDLERS: Dict[type, Callable] = {
+        Variable: _iter_literals_of_variable,
+        BitwiseNegate: _iter_literals_of_negation,
+        BitwiseOr: _iter_literals_of_operands,
+        BitwiseAnd: _iter_literals_of_operands,
+    }
+
     OPERAND_MAPPING = {
         "==": pseudo.OperationType.equal,
         "!=": pseudo.OperationType.not_equal,
@@ -499,22 +816,48 @@ class PseudoCustomLogicCondition(PseudoLogicInterface, CustomLogicCondition, Gen
         if condition.is_disjunction:
             return cls._get_condition_of_disjunction(condition, condition_map)
 
+        shared_conditions: Dict[Tuple[Variable, bool], WorldObject] = dict()
         operands = list()
         for conjunction in condition.operands:
             if conjunction.is_literal:
-                operands.append(cls._get_condition_of_literal(conjunction, condition_map)._condition)
+                operands.append(cls._get_shared_condition_of_literal(conjunction, condition_map, shared_conditions))
             else:
-                operands.append(cls._get_condition_of_disjunction(conjunction, condition_map)._condition)
+                operands.append(cls._get_condition_of_disjunction(conjunction, condition_map, shared_conditions)._condition)
 
         return cls(condition.context.bitwise_and(*operands))
 
     @classmethod
-    def _get_condition_of_disjunction(cls, disjunction: LOGICCLASS, condition_map: Dict[LOGICCLASS, PseudoLOGICCLASS]) -> PseudoLOGICCLASS:
+    def _get_condition_of_disjunction(
+        cls,
+        disjunction: LOGICCLASS,
+        condition_map: Dict[LOGICCLASS, PseudoLOGICCLASS],
+        shared_conditions: Optional[Dict[Tuple[Variable, bool], WorldObject]] = None,
+    ) -> PseudoLOGICCLASS:
         """Return for a disjunction (Or) the corresponding z3-condition."""
         assert disjunction.is_disjunction, f"The input must be a disjunction, but it is {disjunction}"
-        operands = [cls._get_condition_of_literal(operand, condition_map)._condition for operand in disjunction.operands]
+        if shared_conditions is None:
+            shared_conditions = dict()
+        operands = [cls._get_shared_condition_of_literal(operand, condition_map, shared_conditions) for operand in disjunction.operands]
         return cls(disjunction.context.bitwise_or(*operands))
 
+    @classmethod
+    def _get_shared_condition_of_literal(
+        cls,
+        literal: LOGICCLASS,
+        condition_map: Dict[LOGICCLASS, PseudoLOGICCLASS],
+        shared_conditions: Dict[Tuple[Variable, bool], WorldObject],
+    ) -> WorldObject:
+        """
+        Return the condition of the given literal on World-level.
+
+        Literals with the same symbol and the same sign share one node, so a literal that occurs in several clauses is only converted once.
+        """
+        world_literal = literal._condition
+        key = (world_literal.operand, True) if isinstance(world_literal, BitwiseNegate) else (world_literal, False)
+        if (shared_condition := shared_conditions.get(key)) is None:
+            shared_condition = shared_conditions[key] = cls._get_condition_of_literal(literal, condition_map)._condition
+        return shared_condition
+
     @staticmethod
     def _get_condition_of_literal(literal: LOGICCLASS, condition_map: Dict[LOGICCLASS, PseudoLOGICCLASS]) -> PseudoLOGICCLASS:
         """Given a literal, i.e., a symbol or a negation of a symbol, return the condition the symbol is mapped to."""
@@ -531,15 +874,38 @@ class PseudoCustomLogicCondition(PseudoLogicInterface, CustomLogicCondition, Gen
         a and b can be any type of Expression. The name of the bitvector reflects the expression as well as
         the SSA-variable names that occur in the expression.
         """
-        if condition.left.type.size != condition.right.type.size:
+        left, right = condition.left, condition.right
+        if left.type.size != right.type.size:
             logging.warning(
-                f"The operands of {condition} have different sizes: {condition.left.type.size} & {condition.right.type.size}. Increase the size of the smaller one."
+                "The operands of %s have different sizes: %d & %d. Increase the size of the smaller one.",
+                condition,
+                left.type.size,
+                right.type.size,
             )
-        bit_vec_size = max(condition.left.type.size, condition.right.type.size, 1)
+        bit_vec_size = max(left.type.size, right.type.size, 1)
+        if (
+            isinstance(left, pseudo.Constant)
+            and isinstance(right, pseudo.Constant)
+            and isinstance(left.value, int)
+            and isinstance(right.value, int)
+        ):
+            is_signed, compare = PseudoCustomLogicCondition.CONSTANT_COMPARISON[condition.operation]
+            value_1, value_2 = (
+                PseudoCustomLogicCondition._bit_vector_value(operand.value, bit_vec_size, is_signed) for operand in (left, right)
+            )
+            return world.constant(1 if compare(value_1, value_2) else 0, 1)
         operand_1: BitVector = PseudoCustomLogicCondition._convert_expression(condition.left, bit_vec_size, world)
         operand_2: BitVector = PseudoCustomLogicCondition._convert_expression(condition.right, bit_vec_size, world)
         return PseudoCustomLogicCondition.SHORTHAND[condition.operation](world, operand_1, operand_2)
 
+    @staticmethod
+    def _bit_vector_value(value: int, bit_vec_size: int, signed: bool) -> int:
+        """Return the value of the given integer as a bit-vector of the given size, interpreted as signed or unsigned."""
+        unsigned_value = value & ((1 << bit_vec_size) - 1)
+        if signed and unsigned_value >> (bit_vec_size - 1):
+            return unsigned_value - (1 << bit_vec_size)
+        return unsigned_value
+
     @staticmethod
     def _convert_expression(expression: pseudo.Expression, bit_vec_size: int, world: World) -> BitVector:
         """Convert the given expression into a z3 bit-vector."""
@@ -549,14 +915,27 @@ class PseudoCustomLogicCondition(PseudoLogicInterface, CustomLogicCondition, Gen
             return world.variable(PseudoCustomLogicCondition._variable_name_for(expression), bit_vec_size)
 
     SHORTHAND = {
-        pseudo.OperationType.equal: lambda world, a, b: world.bool_equal(a, b),
-        pseudo.OperationType.not_equal: lambda world, a, b: world.bool_unequal(a, b),
-        pseudo.OperationType.less: lambda world, a, b: world.signed_lt(a, b),
-        pseudo.OperationType.less_or_equal: lambda world, a, b: world.signed_le(a, b),
-        pseudo.OperationType.greater: lambda world, a, b: world.signed_gt(a, b),
-        pseudo.OperationType.greater_or_equal: lambda world, a, b: world.signed_ge(a, b),
-        pseudo.OperationType.greater_us: lambda world, a, b: world.unsigned_gt(a, b),
-        pseudo.OperationType.less_us: lambda world, a, b: world.unsigned_lt(a, b),
-        pseudo.OperationType.greater_or_equal_us: lambda world, a, b: world.unsigned_ge(a, b),
-        pseudo.OperationType.less_or_equal_us: lambda world, a, b: world.unsigned_le(a, b),
+        pseudo.OperationType.equal: World.bool_equal,
+        pseudo.OperationType.not_equal: World.bool_unequal,
+        pseudo.OperationType.less: World.signed_lt,
+        pseudo.OperationType.less_or_equal: World.signed_le,
+        pseudo.OperationType.greater: World.signed_gt,
+        pseudo.OperationType.greater_or_equal: World.signed_ge,
+        pseudo.OperationType.greater_us: World.unsigned_gt,
+        pseudo.OperationType.less_us: World.unsigned_lt,
+        pseudo.OperationType.greater_or_equal_us: World.unsigned_ge,
+        pseudo.OperationType.less_or_equal_us: World.unsigned_le,
+    }
+
+    CONSTANT_COMPARISON: Dict[pseudo.OperationType, Tuple[bool, Callable[[int, int], bool]]] = {
+        pseudo.OperationType.equal: (False, operator.eq),
+        pseudo.OperationType.not_equal: (False, operator.ne),
+        pseudo.OperationType.less: (True, operator.lt),
+        pseudo.OperationType.less_or_equal: (True, operator.le),
+        pseudo.OperationType.greater: (True, operator.gt),
+        pseudo.OperationType.greater_or_equal: (True, operator.ge),
+        pseudo.OperationType.greater_us: (False, operator.gt),
+        pseudo.OperationType.less_us: (False, operator.lt),
+        pseudo.OperationType.greater_or_equal_us: (False, operator.ge),
+        pseudo.OperationType.less_or_equal_us: (False, operator.le),
     }
@@ -237,6 +237,13 @@ class TestCustomLogicCondition:
     def test_is_cnf_form(self, world, term, result):
         assert term.is_cnf_form == result
 
+    def test_cached_properties_after_modification(self):
+        world = World()
+        term = (custom_x(1, world) & custom_x(2, world)) | custom_x(3, world)
+        assert not term.is_cnf_form and len(term) == 3
+        term.to_cnf()
+        assert term.is_cnf_form and len(term) == 4
+
     @pytest.mark.parametrize(
         "world, term1, term2, result",
         [
@@ -296,6 +303,9 @@ class TestCustomLogicCondition:
         [
             (world := World(), custom_x(1, world), custom_x(1, world) | custom_x(2, world), True),
             (world := World(), custom_x(1, world), custom_x(1, world) & custom_x(2, world), False),
+            (world := World(), custom_x(1, world) & custom_x(2, world) & custom_x(3, world), custom_x(3, world) & custom_x(1, world), True),
+            (world := World(), custom_x(1, world), true_value(world), True),
+            (world := World(), false_value(world), custom_x(1, world), True),
             (
                 world := World(),
                 (custom_x(1, world) | custom_x(2, world)) & (~custom_x(1, world) | custom_x(3, world)),
@@ -574,6 +584,22 @@ class TestCustomLogicCondition:
         cond2 = CustomLogicCondition(term2)
         assert cond1.is_equal_to(cond2) == result and cond1.context != cond2.context
 
+    def test_canonical_key_of_comparisons(self):
+        world = World()
+        condition = CustomLogicCondition(world.signed_lt(custom_variable(world), custom_constant(world, 5)))
+        mirrored_condition = CustomLogicCondition(world.signed_gt(custom_constant(world, 5), custom_variable(world)))
+        inverse_condition = CustomLogicCondition(world.signed_ge(custom_variable(world), custom_constant(world, 5)))
+        assert condition._canonical_key(condition._condition) == mirrored_condition._canonical_key(mirrored_condition._condition)
+        assert condition._canonical_key_of_negation(condition._condition) == inverse_condition._canonical_key(inverse_condition._condition)
+        assert condition._canonical_key(condition._condition) != inverse_condition._canonical_key(inverse_condition._condition)
+
+    def test_is_equal_to_same_context(self):
+        world = World()
+        cond1 = CustomLogicCondition(world.bitwise_and(b_x(1, world), world.bitwise_or(b_x(2, world), b_x(3, world)), b_x(2, world)))
+        cond2 = CustomLogicCondition(world.bitwise_and(b_x(2, world), b_x(1, world), world.bitwise_or(b_x(3, world), b_x(2, world))))
+        cond3 = CustomLogicCondition(world.bitwise_and(b_x(1, world), world.bitwise_or(b_x(2, world), b_x(3, world))))
+        assert cond1.is_equal_to(cond2) and cond2.is_equal_to(cond1) and not cond1.is_equal_to(cond3) and cond1.is_equal_to(cond1.copy())
+
     @pytest.mark.parametrize("term, cnf_term", _get_normal_forms("cnf"))
     def test_to_cnf(self, term, cnf_term):
         """Bring condition tag into cnf-form."""
@@ -585,6 +611,11 @@ class TestCustomLogicCondition:
         input_term = str(term)
         assert term.to_dnf().is_equal_to(dnf_term) and input_term == str(term)
 
+    @pytest.mark.parametrize("term, dnf_term", _get_normal_forms("dnf"))
+    def test_to_dnf_repeated(self, term, dnf_term):
+        first_dnf = term.to_dnf()
+        assert term.to_dnf().is_equal_to(dnf_term) and first_dnf.is_equal_to(dnf_term)
+
     @pytest.mark.parametrize(
         "term, simplified",
         [
@@ -626,7 +657,8 @@ class TestCustomLogicCondition:
         cond = world.bitwise_and(world.variable("x1", 1), world.bitwise_negate(world.variable("x2", 1)))
         log_cond = CustomLogicCondition(cond, tmp=True)
         log_cond.simplify()
-        assert log_cond
+        expected = CustomLogicCondition(world.bitwise_and(world.variable("x1", 1), world.bitwise_negate(world.variable("x2", 1))))
+        assert isinstance(log_cond._variable, TmpVariable) and log_cond.is_equal_to(expected)
 
     @pytest.mark.parametrize(
         "term, result",
@@ -759,6 +791,13 @@ class TestCustomLogicCondition:
         term.simplify()
         assert term.is_equal_to(result.simplify())
 
+    def test_substitute_by_true_reordered_clause(self):
+        world = World()
+        term = (custom_x(1, world) | custom_x(2, world)) & custom_x(3, world)
+        term.substitute_by_true(custom_x(2, world) | custom_x(1, world))
+        term.simplify()
+        assert term.is_equal_to(custom_x(3, world))
+
     @pytest.mark.parametrize(
         "term, conditions, result",
         [
@@ -893,8 +932,32 @@ class TestPseudoCustomLogicCondition:
         cond = PseudoCustomLogicCondition.initialize_from_condition(condition, world)
         assert str(cond) == result and world == cond.context
 
+    @pytest.mark.parametrize(
+        "condition, result",
+        [
+            (Condition(OperationType.equal, [constant_5, Constant(5)]), "true"),
+            (Condition(OperationType.not_equal, [constant_5, Constant(5)]), "false"),
+            (Condition(OperationType.less, [Constant(-1, Integer.int32_t()), Constant(1, Integer.int32_t())]), "true"),
+            (Condition(OperationType.less_us, [Constant(-1, Integer.int32_t()), Constant(1, Integer.int32_t())]), "false"),
+            (Condition(OperationType.greater_or_equal_us, [Constant(-1, Integer.int32_t()), Constant(1, Integer.int32_t())]), "true"),
+        ],
+    )
+    def test_initialize_from_condition_of_constants(self, condition, result):
+        world = World()
+        cond = PseudoCustomLogicCondition.initialize_from_condition(condition, world)
+        assert str(cond) == result
+
     def test_initialize_from_formula(self):
-        pass
+        world = World()
+        condition_map = {custom_x(i, world): lower(custom_variable(world, f"a{i}"), i) for i in (1, 2, 3)}
+        formula = CustomLogicCondition(
+            world.bitwise_and(
+                world.bitwise_or(world.bitwise_negate(b_x(1, world)), b_x(2, world)),
+                world.bitwise_or(world.bitwise_negate(b_x(1, world)), b_x(3, world)),
+            )
+        )
+        clause_1, clause_2 = PseudoCustomLogicCondition.initialize_from_formula(formula, condition_map)._condition.operands
+        assert len({id(operand) for operand in clause_1.operands} & {id(operand) for operand in clause_2.operands}) == 1
 
     @pytest.mark.parametrize(
         "term, result",